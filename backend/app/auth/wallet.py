@@ -1,24 +1,120 @@
 """
 Wallet authentication - verify wallet signatures for authentication
 """
-from eth_account.messages import encode_defunct
-from web3 import Web3
-from datetime import datetime, timedelta
-from typing import Optional
+from cchecksum import to_checksum_address as _c_checksum
+from coincurve import PublicKey
+from eth_hash.auto import keccak
+from functools import lru_cache
+from pydantic import AfterValidator
+from typing import Annotated, Optional
+import asyncio
+import hmac
+import logging
+import re
+import time
+
+logger = logging.getLogger(__name__)
+
+# 0x-prefixed, 20-byte hex address (any case)
+_HEX_ADDR_RE = re.compile(r"0x[0-9a-fA-F]{40}")
+
+# 65-byte r||s||v signature as hex, with or without 0x
+_HEX_SIG_RE = re.compile(r"(?:0x)?[0-9a-fA-F]{130}")
+
+# secp256k1n / 2 - signatures with a higher s are malleable duplicates (EIP-2)
+_SECP256K1_HALF_N = 0x7FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF5D576E7357A4501DDFE92F46681B20A0
+
+# EIP-191 version 0x45 ("E") personal message prefix
+_PREFIX = b"\x19Ethereum Signed Message:\n"
+
+
+def _eip191(msg: str) -> bytes:
+    """Encode a text message as an EIP-191 personal message, ready for hashing"""
+    body = msg.encode("utf-8")
+    return _PREFIX + str(len(body)).encode() + body
+
+
+def _signature_bytes(signature) -> Optional[bytes]:
+    """
+    Return the raw 65 signature bytes, or None if the input cannot be a valid signature
+    Rejects malformed input, bad recovery ids and high-s values before any ECDSA work
+    """
+    if isinstance(signature, str):
+        if not _HEX_SIG_RE.fullmatch(signature):
+            return None
+        sig = bytes.fromhex(signature[-130:])
+    elif isinstance(signature, (bytes, bytearray)) and len(signature) == 65:
+        sig = bytes(signature)
+    else:
+        return None
+
+    v = sig[64]
+    if v < 27:
+        v += 27
+    if v not in (27, 28):
+        return None
+    if int.from_bytes(sig[32:64], "big") > _SECP256K1_HALF_N:
+        return None
+    return sig
+
+
+@lru_cache(maxsize=4096)
+def _cached_checksum(addr_lower: str) -> str:
+    """Memoized EIP-55 conversion (C implementation), keyed on the lowercased address"""
+    return _c_checksum(addr_lower)
+
+
+def _is_valid_hex_address(address: str) -> bool:
+    """
+    Shape check plus EIP-55 verification for mixed-case input.
+    All-lower / all-upper addresses carry no checksum and are accepted as-is.
+    """
+    if not isinstance(address, str) or not _HEX_ADDR_RE.fullmatch(address):
+        return False
+    body = address[2:]
+    if body.islower() or body.isupper():
+        return True
+    return _cached_checksum(address.lower()) == address
+
+
+def _checksum_validator(address: str) -> str:
+    """Pydantic validator: reject malformed addresses and return the EIP-55 form"""
+    if not _is_valid_hex_address(address):
+        raise ValueError("Invalid wallet address")
+    return _cached_checksum(address.lower())
+
+
+# Request field type - addresses are checksummed once at ingress and passed through as-is
+ChecksumAddress = Annotated[str, AfterValidator(_checksum_validator)]
 
 
 class WalletAuth:
     """Wallet signature verification for authentication"""
 
-    def __init__(self):
-        self.w3 = Web3()
+    def _recover_address_bytes(self, message: str, signature: bytes) -> bytes:
+        """
+        Recover the 20-byte signer address of an EIP-191 personal message
+        Expects a signature already checked by _signature_bytes; uses libsecp256k1 (coincurve)
+        """
+        v = signature[64]
+        if v >= 27:
+            v -= 27
+
+        message_hash = keccak(_eip191(message))
+
+        public_key = PublicKey.from_signature_and_message(
+            signature[:64] + bytes([v]),
+            message_hash,
+            hasher=None
+        )
+        return keccak(public_key.format(compressed=False)[1:])[-20:]
 
     def create_message(self, wallet_address: str, nonce: str) -> str:
         """
         Create a message for the user to sign
         This prevents replay attacks by including a nonce and timestamp
         """
-        timestamp = datetime.utcnow().isoformat()
+        timestamp = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
         return f"Sign this message to authenticate with Agent Payment Platform\n\nWallet: {wallet_address}\nNonce: {nonce}\nTimestamp: {timestamp}"
 
     def verify_signature(self, message: str, signature: str, expected_address: str) -> bool:
@@ -26,49 +122,51 @@ class WalletAuth:
         Verify that a signature matches the expected address
         Returns True if signature is valid, False otherwise
         """
-        try:
-            # Encode the message
-            encoded_message = encode_defunct(text=message)
+        sig = _signature_bytes(signature)
+        if sig is None:
+            return False
 
+        try:
             # Recover the address from the signature
-            recovered_address = self.w3.eth.account.recover_message(
-                encoded_message,
-                signature=signature
-            )
+            recovered_address = "0x" + self._recover_address_bytes(message, sig).hex()
 
-            # Compare addresses (case-insensitive)
-            return recovered_address.lower() == expected_address.lower()
+            # Compare addresses (case-insensitive, constant time)
+            return hmac.compare_digest(recovered_address, expected_address.lower())
 
         except Exception as e:
-            print(f"Error verifying signature: {e}")
+            logger.debug("Error verifying signature: %s", e)
             return False
 
+    async def averify_signature(self, message: str, signature: str, expected_address: str) -> bool:
+        """
+        Async variant of verify_signature for use in route handlers
+        Runs the CPU-bound ECDSA recovery in a worker thread so it does not block the event loop
+        """
+        return await asyncio.to_thread(self.verify_signature, message, signature, expected_address)
+
     def extract_wallet_from_signature(self, message: str, signature: str) -> Optional[str]:
         """
         Extract the wallet address from a signature
         Returns the address if valid, None otherwise
         """
+        sig = _signature_bytes(signature)
+        if sig is None:
+            return None
+
         try:
-            encoded_message = encode_defunct(text=message)
-            recovered_address = self.w3.eth.account.recover_message(
-                encoded_message,
-                signature=signature
-            )
-            return recovered_address
+            recovered_address = self._recover_address_bytes(message, sig)
+            return _c_checksum("0x" + recovered_address.hex())
         except Exception as e:
-            print(f"Error extracting wallet: {e}")
+            logger.debug("Error extracting wallet: %s", e)
             return None
 
     def is_valid_address(self, address: str) -> bool:
-        """Check if an Ethereum address is valid"""
-        try:
-            return Web3.is_address(address)
-        except Exception:
-            return False
+        """Check if an Ethereum address is valid (mixed-case input must match EIP-55)"""
+        return _is_valid_hex_address(address)
 
     def to_checksum_address(self, address: str) -> str:
         """Convert address to checksum format"""
-        return Web3.to_checksum_address(address)
+        return _cached_checksum(address.lower())
 
 
 # Create global instance
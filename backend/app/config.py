@@ -19,9 +19,12 @@ class Settings(BaseSettings):
 
     # Blockchain
     RPC_URL: str = "https://sepolia.base.org"
+    WSS_URL: Optional[str] = None  # Optional websocket endpoint, used to wait for receipts
     CHAIN_ID: int = 84532  # Base Sepolia
     CONTRACT_ADDRESS: str = "0x0000000000000000000000000000000000000000"  # Update after deployment
     USDC_ADDRESS: str = "0x036CbD53842c5426634e7929541eC2318f3dCF7e"  # Base Sepolia USDC
+    RPC_BATCHING_STRATEGY: str = "multicall"  # "multicall" (Multicall3) or "jsonrpc" (JSON-RPC batch)
+    VIEW_CACHE_TTL: float = 10  # Seconds to reuse contract view results (~1 block on L1, several on L2)
 
     # CORS
     CORS_ORIGINS: list[str] = ["http://localhost:5173", "http://localhost:3000"]
@@ -3,12 +3,47 @@ Main FastAPI application
 Initializes the API server with all routes and middleware
 """
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
+from logging.handlers import QueueHandler, QueueListener
+import logging
+import queue
 from app.config import settings
 from app.database import init_db, close_db
 from app.routes import funds, agents, transactions
-from app.services.blockchain import blockchain_service
+from app.services.blockchain import get_blockchain_service
+
+
+def start_app_logging() -> tuple[QueueHandler, QueueListener] | None:
+    """
+    Route "app.*" loggers through a queue drained by a background thread
+    Request handlers only enqueue records; formatting and stream I/O happen off the event loop
+    Skipped if the root logger already has handlers (e.g. a uvicorn log config); records propagate there
+    """
+    app_logger = logging.getLogger("app")
+    app_logger.setLevel(logging.DEBUG if settings.DEBUG else logging.INFO)
+    if logging.getLogger().handlers:
+        return None
+
+    log_queue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+    queue_handler = QueueHandler(log_queue)
+    app_logger.addHandler(queue_handler)
+
+    listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    listener.start()
+    return queue_handler, listener
+
+
+def stop_app_logging(app_logging: tuple[QueueHandler, QueueListener] | None):
+    """Detach the queue handler installed by start_app_logging and flush pending records"""
+    if app_logging is None:
+        return
+    queue_handler, listener = app_logging
+    logging.getLogger("app").removeHandler(queue_handler)
+    listener.stop()
 
 
 @asynccontextmanager
@@ -18,8 +53,11 @@ async def lifespan(app: FastAPI):
     Initializes database on startup, closes on shutdown
     """
     # Startup
+    app_logging = start_app_logging()
     print("🚀 Starting AgentPay API...")
-    print(f"📡 Connected to blockchain: {blockchain_service.is_connected()}")
+    blockchain_service = get_blockchain_service()
+    await blockchain_service.startup()
+    print(f"📡 Connected to blockchain: {await blockchain_service.is_connected()}")
     print(f"🔗 RPC URL: {settings.RPC_URL}")
     print(f"📝 Contract Address: {settings.CONTRACT_ADDRESS}")
 
@@ -31,8 +69,10 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     print("🛑 Shutting down...")
+    await blockchain_service.close()
     await close_db()
     print("✅ Database connections closed")
+    stop_app_logging(app_logging)
 
 
 # Create FastAPI app
@@ -41,6 +81,7 @@ app = FastAPI(
     version=settings.APP_VERSION,
     description="Backend API for AgentPay - Payment infrastructure for autonomous AI agents",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Configure CORS
@@ -65,7 +106,7 @@ async def root():
         "name": settings.APP_NAME,
         "version": settings.APP_VERSION,
         "status": "online",
-        "blockchain_connected": blockchain_service.is_connected(),
+        "blockchain_connected": await get_blockchain_service().is_connected(),
         "chain_id": settings.CHAIN_ID,
         "contract_address": settings.CONTRACT_ADDRESS,
     }
@@ -76,7 +117,7 @@ async def health():
     """Health check endpoint"""
     return {
         "status": "healthy",
-        "blockchain": "connected" if blockchain_service.is_connected() else "disconnected",
+        "blockchain": "connected" if await get_blockchain_service().is_connected() else "disconnected",
     }
 
 
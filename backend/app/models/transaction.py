@@ -1,7 +1,8 @@
 """
 Transaction model - represents a purchase transaction
 """
-from sqlalchemy import Column, Integer, String, DateTime, Numeric, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, DateTime, Numeric, ForeignKey, Text, Index
+from sqlalchemy.dialects import sqlite
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.database import Base
@@ -13,17 +14,32 @@ class Transaction(Base):
     __tablename__ = "transactions"
 
     id = Column(Integer, primary_key=True, index=True)
-    fund_id = Column(Integer, ForeignKey("funds.id"), nullable=False, index=True)
+    fund_id = Column(Integer, ForeignKey("funds.id"), nullable=False)  # Indexed via ix_tx_fund_ts
     agent_id = Column(Integer, ForeignKey("agents.id"), nullable=False, index=True)
     amount = Column(Numeric(20, 6), nullable=False)  # Amount in USDC (6 decimals)
     fee = Column(Numeric(20, 6), nullable=False)  # Platform fee
     tx_hash = Column(String(66), unique=True, nullable=False, index=True)
     tx_metadata = Column(Text, nullable=True)  # Renamed from 'metadata' (reserved keyword)
-    timestamp = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+    # SQLite's CURRENT_TIMESTAMP has no fractional seconds; bind cursor values in the same
+    # format so (timestamp, id) keyset comparisons match stored rows exactly
+    timestamp = Column(
+        DateTime(timezone=True).with_variant(
+            sqlite.DATETIME(storage_format="%(year)04d-%(month)02d-%(day)02d %(hour)02d:%(minute)02d:%(second)02d"),
+            "sqlite",
+        ),
+        server_default=func.now(),
+        index=True,
+    )
 
-    # Relationships
-    fund = relationship("Fund", back_populates="transactions")
-    agent = relationship("Agent", back_populates="transactions")
+    # Serves the per-fund "newest first" keyset pagination with a single index range scan
+    __table_args__ = (
+        Index("ix_tx_fund_ts", fund_id, timestamp.desc(), id.desc()),
+    )
+
+    # Relationships - routes select the needed columns directly; ORM callers must opt in
+    # with an explicit loader such as selectinload(Transaction.fund) instead of lazy loading
+    fund = relationship("Fund", back_populates="transactions", lazy="raise")
+    agent = relationship("Agent", back_populates="transactions", lazy="raise")
 
     def __repr__(self):
         return f"<Transaction(id={self.id}, fund_id={self.fund_id}, agent_id={self.agent_id}, amount={self.amount})>"
@@ -2,13 +2,14 @@
 Agents routes - handle AI agent marketplace CRUD operations
 """
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from pydantic import BaseModel
 from decimal import Decimal
 from app.database import get_db
 from app.models.agent import Agent
-from app.auth.wallet import wallet_auth
+from app.auth.wallet import ChecksumAddress, wallet_auth
 
 router = APIRouter(prefix="/agents", tags=["agents"])
 
@@ -16,15 +17,15 @@ router = APIRouter(prefix="/agents", tags=["agents"])
 # Pydantic schemas
 class AgentCreate(BaseModel):
     name: str
-    wallet_address: str
-    price: float
+    wallet_address: ChecksumAddress
+    price: Decimal
     description: str | None = None
     image_url: str | None = None
 
 
 class AgentUpdate(BaseModel):
     name: str | None = None
-    price: float | None = None
+    price: Decimal | None = None
     description: str | None = None
     image_url: str | None = None
     is_active: bool | None = None
@@ -42,16 +43,42 @@ class AgentResponse(BaseModel):
     updated_at: str | None
 
 
+# Columns returned by list_agents, in row order
+_AGENT_COLUMNS = (
+    Agent.id,
+    Agent.name,
+    Agent.wallet_address,
+    Agent.price,
+    Agent.description,
+    Agent.image_url,
+    Agent.is_active,
+    Agent.created_at,
+    Agent.updated_at,
+)
+
+
+def _agent_response(agent: Agent) -> AgentResponse:
+    """Build the response directly from the model, skipping validation of trusted DB data"""
+    return AgentResponse.model_construct(
+        id=agent.id,
+        name=agent.name,
+        wallet_address=agent.wallet_address,
+        price=str(agent.price),
+        description=agent.description,
+        image_url=agent.image_url,
+        is_active=agent.is_active,
+        created_at=agent.created_at.isoformat() if agent.created_at else None,
+        updated_at=agent.updated_at.isoformat() if agent.updated_at else None,
+    )
+
+
 @router.post("/", response_model=AgentResponse)
 async def create_agent(agent_data: AgentCreate, db: AsyncSession = Depends(get_db)):
     """
     Create a new AI agent in the marketplace
     """
-    # Validate wallet address
-    if not wallet_auth.is_valid_address(agent_data.wallet_address):
-        raise HTTPException(status_code=400, detail="Invalid wallet address")
-
-    checksum_address = wallet_auth.to_checksum_address(agent_data.wallet_address)
+    # AgentCreate has already validated and checksummed the wallet address
+    checksum_address = agent_data.wallet_address
 
     # Check if agent with this wallet already exists
     result = await db.execute(
@@ -66,7 +93,7 @@ async def create_agent(agent_data: AgentCreate, db: AsyncSession = Depends(get_d
     new_agent = Agent(
         name=agent_data.name,
         wallet_address=checksum_address,
-        price=Decimal(str(agent_data.price)),
+        price=agent_data.price,
         description=agent_data.description,
         image_url=agent_data.image_url,
     )
@@ -74,7 +101,7 @@ async def create_agent(agent_data: AgentCreate, db: AsyncSession = Depends(get_d
     await db.commit()
     await db.refresh(new_agent)
 
-    return AgentResponse(**new_agent.to_dict())
+    return _agent_response(new_agent)
 
 
 @router.get("/", response_model=list[AgentResponse])
@@ -87,17 +114,30 @@ async def list_agents(
     """
     List all AI agents in the marketplace
     Can filter by active status
+    Rows are serialized straight to JSON, bypassing response model validation
     """
-    query = select(Agent)
+    query = select(*_AGENT_COLUMNS)
 
     if active_only:
         query = query.where(Agent.is_active == True)
 
     query = query.offset(skip).limit(limit)
     result = await db.execute(query)
-    agents = result.scalars().all()
 
-    return [AgentResponse(**agent.to_dict()) for agent in agents]
+    return ORJSONResponse([
+        {
+            "id": row[0],
+            "name": row[1],
+            "wallet_address": row[2],
+            "price": str(row[3]),
+            "description": row[4],
+            "image_url": row[5],
+            "is_active": row[6],
+            "created_at": row[7].isoformat() if row[7] else None,
+            "updated_at": row[8].isoformat() if row[8] else None,
+        }
+        for row in result.all()
+    ])
 
 
 @router.get("/{agent_id}", response_model=AgentResponse)
@@ -113,7 +153,7 @@ async def get_agent(agent_id: int, db: AsyncSession = Depends(get_db)):
     if not agent:
         raise HTTPException(status_code=404, detail="Agent not found")
 
-    return AgentResponse(**agent.to_dict())
+    return _agent_response(agent)
 
 
 @router.get("/wallet/{wallet_address}", response_model=AgentResponse)
@@ -134,7 +174,7 @@ async def get_agent_by_wallet(wallet_address: str, db: AsyncSession = Depends(ge
     if not agent:
         raise HTTPException(status_code=404, detail="Agent not found")
 
-    return AgentResponse(**agent.to_dict())
+    return _agent_response(agent)
 
 
 @router.put("/{agent_id}", response_model=AgentResponse)
@@ -154,7 +194,7 @@ async def update_agent(agent_id: int, agent_data: AgentUpdate, db: AsyncSession
     if agent_data.name is not None:
         agent.name = agent_data.name
     if agent_data.price is not None:
-        agent.price = Decimal(str(agent_data.price))
+        agent.price = agent_data.price
     if agent_data.description is not None:
         agent.description = agent_data.description
     if agent_data.image_url is not None:
@@ -165,7 +205,7 @@ async def update_agent(agent_id: int, agent_data: AgentUpdate, db: AsyncSession
     await db.commit()
     await db.refresh(agent)
 
-    return AgentResponse(**agent.to_dict())
+    return _agent_response(agent)
 
 
 @router.delete("/{agent_id}")
@@ -1,21 +1,24 @@
 """
 Funds routes - handle fund account operations
 """
+import asyncio
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from pydantic import BaseModel
+from decimal import Decimal
 from app.database import get_db
 from app.models.fund import Fund
-from app.services.blockchain import blockchain_service
-from app.auth.wallet import wallet_auth
+from app.services.blockchain import get_blockchain_service
+from app.auth.wallet import ChecksumAddress, wallet_auth
 
 router = APIRouter(prefix="/funds", tags=["funds"])
 
 
 # Pydantic schemas
 class FundCreate(BaseModel):
-    wallet_address: str
+    wallet_address: ChecksumAddress
 
 
 class FundResponse(BaseModel):
@@ -25,14 +28,24 @@ class FundResponse(BaseModel):
     updated_at: str | None
 
 
+def _fund_response(fund: Fund) -> FundResponse:
+    """Build the response directly from the model, skipping validation of trusted DB data"""
+    return FundResponse.model_construct(
+        id=fund.id,
+        wallet_address=fund.wallet_address,
+        created_at=fund.created_at.isoformat() if fund.created_at else None,
+        updated_at=fund.updated_at.isoformat() if fund.updated_at else None,
+    )
+
+
 class FundBalanceResponse(BaseModel):
     wallet_address: str
-    balance: float
-    daily_spending_limit: float
-    per_transaction_limit: float
-    today_spent: float
+    balance: Decimal
+    daily_spending_limit: Decimal
+    per_transaction_limit: Decimal
+    today_spent: Decimal
     last_reset_day: int
-    usdc_wallet_balance: float
+    usdc_wallet_balance: Decimal
 
 
 @router.post("/", response_model=FundResponse)
@@ -41,12 +54,8 @@ async def create_fund(fund_data: FundCreate, db: AsyncSession = Depends(get_db))
     Create a new fund account
     Validates wallet address and stores in database
     """
-    # Validate wallet address
-    if not wallet_auth.is_valid_address(fund_data.wallet_address):
-        raise HTTPException(status_code=400, detail="Invalid wallet address")
-
-    # Convert to checksum address
-    checksum_address = wallet_auth.to_checksum_address(fund_data.wallet_address)
+    # FundCreate has already validated and checksummed the wallet address
+    checksum_address = fund_data.wallet_address
 
     # Check if fund already exists
     result = await db.execute(
@@ -63,7 +72,7 @@ async def create_fund(fund_data: FundCreate, db: AsyncSession = Depends(get_db))
     await db.commit()
     await db.refresh(new_fund)
 
-    return FundResponse(**new_fund.to_dict())
+    return _fund_response(new_fund)
 
 
 @router.get("/", response_model=list[FundResponse])
@@ -71,13 +80,23 @@ async def list_funds(skip: int = 0, limit: int = 100, db: AsyncSession = Depends
     """
     List all funds
     Supports pagination with skip and limit
+    Rows are serialized straight to JSON, bypassing response model validation
     """
     result = await db.execute(
-        select(Fund).offset(skip).limit(limit)
+        select(Fund.id, Fund.wallet_address, Fund.created_at, Fund.updated_at)
+        .offset(skip)
+        .limit(limit)
     )
-    funds = result.scalars().all()
 
-    return [FundResponse(**fund.to_dict()) for fund in funds]
+    return ORJSONResponse([
+        {
+            "id": row[0],
+            "wallet_address": row[1],
+            "created_at": row[2].isoformat() if row[2] else None,
+            "updated_at": row[3].isoformat() if row[3] else None,
+        }
+        for row in result.all()
+    ])
 
 
 @router.get("/{wallet_address}", response_model=FundResponse)
@@ -99,7 +118,7 @@ async def get_fund(wallet_address: str, db: AsyncSession = Depends(get_db)):
     if not fund:
         raise HTTPException(status_code=404, detail="Fund not found")
 
-    return FundResponse(**fund.to_dict())
+    return _fund_response(fund)
 
 
 @router.get("/{wallet_address}/balance", response_model=FundBalanceResponse)
@@ -114,15 +133,16 @@ async def get_fund_balance(wallet_address: str, db: AsyncSession = Depends(get_d
 
     checksum_address = wallet_auth.to_checksum_address(wallet_address)
 
-    # Get balance from blockchain
-    balance_info = blockchain_service.get_fund_balance(checksum_address)
+    # Get vault balance and USDC wallet balance from blockchain concurrently
+    blockchain_service = get_blockchain_service()
+    balance_info, usdc_balance = await asyncio.gather(
+        blockchain_service.get_fund_balance(checksum_address),
+        blockchain_service.get_usdc_balance(checksum_address),
+    )
 
     if "error" in balance_info:
         raise HTTPException(status_code=500, detail=f"Blockchain error: {balance_info['error']}")
 
-    # Get USDC balance in wallet
-    usdc_balance = blockchain_service.get_usdc_balance(checksum_address)
-
     return FundBalanceResponse(
         wallet_address=checksum_address,
         balance=balance_info["balance"],
@@ -3,14 +3,16 @@ Transactions routes - handle transaction history
 """
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, desc
+from sqlalchemy import select, desc, tuple_
+from sqlalchemy.exc import IntegrityError
 from pydantic import BaseModel
+from datetime import datetime
 from decimal import Decimal
 from app.database import get_db
 from app.models.transaction import Transaction
 from app.models.fund import Fund
 from app.models.agent import Agent
-from app.services.blockchain import blockchain_service
+from app.services.blockchain import get_blockchain_service
 from app.auth.wallet import wallet_auth
 
 router = APIRouter(prefix="/transactions", tags=["transactions"])
@@ -20,8 +22,8 @@ router = APIRouter(prefix="/transactions", tags=["transactions"])
 class TransactionCreate(BaseModel):
     fund_id: int
     agent_id: int
-    amount: float
-    fee: float
+    amount: Decimal
+    fee: Decimal
     tx_hash: str
     tx_metadata: str | None = None
 
@@ -39,89 +41,133 @@ class TransactionResponse(BaseModel):
     agent_name: str | None = None
 
 
-@router.post("/", response_model=TransactionResponse)
-async def create_transaction(tx_data: TransactionCreate, db: AsyncSession = Depends(get_db)):
+# Exact columns needed for TransactionResponse, fetched as plain rows instead of ORM entities
+_TRANSACTION_COLUMNS = (
+    Transaction.id,
+    Transaction.fund_id,
+    Transaction.agent_id,
+    Transaction.amount,
+    Transaction.fee,
+    Transaction.tx_hash,
+    Transaction.tx_metadata,
+    Transaction.timestamp,
+    Fund.wallet_address,
+    Agent.name,
+)
+
+
+def _transaction_query():
+    """Select the response columns with the fund and agent joins applied"""
+    return (
+        select(*_TRANSACTION_COLUMNS)
+        .select_from(Transaction)
+        .join(Fund, Transaction.fund_id == Fund.id)
+        .join(Agent, Transaction.agent_id == Agent.id)
+    )
+
+
+def _paginate(query, before_ts: datetime | None, before_id: int | None, limit: int):
     """
-    Record a new transaction
-    This is typically called after a successful on-chain purchase
+    Apply keyset pagination, newest first
+    Pass the timestamp and id of the last row of the previous page to fetch the next one
     """
-    # Verify fund exists
-    fund_result = await db.execute(
-        select(Fund).where(Fund.id == tx_data.fund_id)
+    if before_ts is not None:
+        if before_id is not None:
+            query = query.where(tuple_(Transaction.timestamp, Transaction.id) < (before_ts, before_id))
+        else:
+            query = query.where(Transaction.timestamp < before_ts)
+    elif before_id is not None:
+        raise HTTPException(status_code=400, detail="before_id requires before_ts")
+
+    return query.order_by(desc(Transaction.timestamp), desc(Transaction.id)).limit(limit)
+
+
+def _transaction_response(row) -> TransactionResponse:
+    """Build the response from a _transaction_query row, skipping validation of trusted DB data"""
+    return TransactionResponse.model_construct(
+        id=row[0],
+        fund_id=row[1],
+        agent_id=row[2],
+        amount=str(row[3]),
+        fee=str(row[4]),
+        tx_hash=row[5],
+        tx_metadata=row[6],
+        timestamp=row[7].isoformat() if row[7] else None,
+        fund_wallet=row[8],
+        agent_name=row[9],
     )
-    fund = fund_result.scalar_one_or_none()
-    if not fund:
-        raise HTTPException(status_code=404, detail="Fund not found")
 
-    # Verify agent exists
-    agent_result = await db.execute(
-        select(Agent).where(Agent.id == tx_data.agent_id)
-    )
-    agent = agent_result.scalar_one_or_none()
-    if not agent:
-        raise HTTPException(status_code=404, detail="Agent not found")
 
-    # Check if transaction already exists (prevent duplicates)
-    existing_result = await db.execute(
-        select(Transaction).where(Transaction.tx_hash == tx_data.tx_hash)
-    )
-    existing_tx = existing_result.scalar_one_or_none()
-    if existing_tx:
-        raise HTTPException(status_code=400, detail="Transaction already recorded")
+async def _insert_error(db: AsyncSession, tx_data: TransactionCreate, error: IntegrityError) -> HTTPException:
+    """
+    Map a rejected transaction insert to the matching HTTP error
+    Only runs on the failure path, so successful inserts pay no extra lookups
+    """
+    if "foreign key" not in str(error.orig).lower():
+        return HTTPException(status_code=400, detail="Transaction already recorded")
 
+    if await db.get(Fund, tx_data.fund_id) is None:
+        return HTTPException(status_code=404, detail="Fund not found")
+    return HTTPException(status_code=404, detail="Agent not found")
+
+
+@router.post("/", response_model=TransactionResponse)
+async def create_transaction(tx_data: TransactionCreate, db: AsyncSession = Depends(get_db)):
+    """
+    Record a new transaction
+    This is typically called after a successful on-chain purchase
+    """
     # Create transaction
     new_transaction = Transaction(
         fund_id=tx_data.fund_id,
         agent_id=tx_data.agent_id,
-        amount=Decimal(str(tx_data.amount)),
-        fee=Decimal(str(tx_data.fee)),
+        amount=tx_data.amount,
+        fee=tx_data.fee,
         tx_hash=tx_data.tx_hash,
         tx_metadata=tx_data.tx_metadata,
     )
     db.add(new_transaction)
-    await db.commit()
-    await db.refresh(new_transaction)
+    # Let the FK and unique constraints validate the insert instead of pre-flight SELECTs
+    try:
+        await db.commit()
+    except IntegrityError as e:
+        await db.rollback()
+        raise await _insert_error(db, tx_data, e)
+
+    result = await db.execute(
+        _transaction_query().where(Transaction.id == new_transaction.id)
+    )
+    transaction = _transaction_response(result.one())
 
-    response_data = new_transaction.to_dict()
-    response_data["fund_wallet"] = fund.wallet_address
-    response_data["agent_name"] = agent.name
+    # The purchase changed the fund's on-chain balance and spending
+    get_blockchain_service().invalidate(transaction.fund_wallet)
 
-    return TransactionResponse(**response_data)
+    return transaction
 
 
 @router.get("/", response_model=list[TransactionResponse])
 async def list_transactions(
-    skip: int = 0,
+    before_ts: datetime | None = None,
+    before_id: int | None = None,
     limit: int = 100,
     db: AsyncSession = Depends(get_db)
 ):
     """
-    List all transactions with pagination
+    List all transactions with keyset pagination
     Ordered by timestamp descending (newest first)
     """
     result = await db.execute(
-        select(Transaction, Fund, Agent)
-        .join(Fund, Transaction.fund_id == Fund.id)
-        .join(Agent, Transaction.agent_id == Agent.id)
-        .order_by(desc(Transaction.timestamp))
-        .offset(skip)
-        .limit(limit)
+        _paginate(_transaction_query(), before_ts, before_id, limit)
     )
 
-    transactions = []
-    for tx, fund, agent in result.all():
-        tx_data = tx.to_dict()
-        tx_data["fund_wallet"] = fund.wallet_address
-        tx_data["agent_name"] = agent.name
-        transactions.append(TransactionResponse(**tx_data))
-
-    return transactions
+    return [_transaction_response(row) for row in result.all()]
 
 
 @router.get("/fund/{fund_id}", response_model=list[TransactionResponse])
 async def get_fund_transactions(
     fund_id: int,
-    skip: int = 0,
+    before_ts: datetime | None = None,
+    before_id: int | None = None,
     limit: int = 100,
     db: AsyncSession = Depends(get_db)
 ):
@@ -129,29 +175,17 @@ async def get_fund_transactions(
     Get all transactions for a specific fund
     """
     result = await db.execute(
-        select(Transaction, Fund, Agent)
-        .join(Fund, Transaction.fund_id == Fund.id)
-        .join(Agent, Transaction.agent_id == Agent.id)
-        .where(Transaction.fund_id == fund_id)
-        .order_by(desc(Transaction.timestamp))
-        .offset(skip)
-        .limit(limit)
+        _paginate(_transaction_query().where(Transaction.fund_id == fund_id), before_ts, before_id, limit)
     )
 
-    transactions = []
-    for tx, fund, agent in result.all():
-        tx_data = tx.to_dict()
-        tx_data["fund_wallet"] = fund.wallet_address
-        tx_data["agent_name"] = agent.name
-        transactions.append(TransactionResponse(**tx_data))
-
-    return transactions
+    return [_transaction_response(row) for row in result.all()]
 
 
 @router.get("/wallet/{wallet_address}", response_model=list[TransactionResponse])
 async def get_wallet_transactions(
     wallet_address: str,
-    skip: int = 0,
+    before_ts: datetime | None = None,
+    before_id: int | None = None,
     limit: int = 100,
     db: AsyncSession = Depends(get_db)
 ):
@@ -175,23 +209,10 @@ async def get_wallet_transactions(
 
     # Get transactions
     result = await db.execute(
-        select(Transaction, Fund, Agent)
-        .join(Fund, Transaction.fund_id == Fund.id)
-        .join(Agent, Transaction.agent_id == Agent.id)
-        .where(Transaction.fund_id == fund.id)
-        .order_by(desc(Transaction.timestamp))
-        .offset(skip)
-        .limit(limit)
+        _paginate(_transaction_query().where(Transaction.fund_id == fund.id), before_ts, before_id, limit)
     )
 
-    transactions = []
-    for tx, fund, agent in result.all():
-        tx_data = tx.to_dict()
-        tx_data["fund_wallet"] = fund.wallet_address
-        tx_data["agent_name"] = agent.name
-        transactions.append(TransactionResponse(**tx_data))
-
-    return transactions
+    return [_transaction_response(row) for row in result.all()]
 
 
 @router.get("/{transaction_id}", response_model=TransactionResponse)
@@ -200,9 +221,7 @@ async def get_transaction(transaction_id: int, db: AsyncSession = Depends(get_db
     Get a specific transaction by ID
     """
     result = await db.execute(
-        select(Transaction, Fund, Agent)
-        .join(Fund, Transaction.fund_id == Fund.id)
-        .join(Agent, Transaction.agent_id == Agent.id)
+        _transaction_query()
         .where(Transaction.id == transaction_id)
     )
 
@@ -210,12 +229,7 @@ async def get_transaction(transaction_id: int, db: AsyncSession = Depends(get_db
     if not row:
         raise HTTPException(status_code=404, detail="Transaction not found")
 
-    tx, fund, agent = row
-    tx_data = tx.to_dict()
-    tx_data["fund_wallet"] = fund.wallet_address
-    tx_data["agent_name"] = agent.name
-
-    return TransactionResponse(**tx_data)
+    return _transaction_response(row)
 
 
 @router.get("/hash/{tx_hash}", response_model=TransactionResponse)
@@ -224,9 +238,7 @@ async def get_transaction_by_hash(tx_hash: str, db: AsyncSession = Depends(get_d
     Get a transaction by its blockchain transaction hash
     """
     result = await db.execute(
-        select(Transaction, Fund, Agent)
-        .join(Fund, Transaction.fund_id == Fund.id)
-        .join(Agent, Transaction.agent_id == Agent.id)
+        _transaction_query()
         .where(Transaction.tx_hash == tx_hash)
     )
 
@@ -234,9 +246,4 @@ async def get_transaction_by_hash(tx_hash: str, db: AsyncSession = Depends(get_d
     if not row:
         raise HTTPException(status_code=404, detail="Transaction not found")
 
-    tx, fund, agent = row
-    tx_data = tx.to_dict()
-    tx_data["fund_wallet"] = fund.wallet_address
-    tx_data["agent_name"] = agent.name
-
-    return TransactionResponse(**tx_data)
+    return _transaction_response(row)
@@ -1,136 +1,399 @@
 """
 Blockchain service - handles Web3 interactions with smart contracts
 """
+import asyncio
 import json
+import logging
+import time
+from decimal import MAX_EMAX, MAX_PREC, MIN_EMIN, Context, Decimal
+from functools import cache, cached_property
 from pathlib import Path
-from web3 import Web3
+from typing import Final
+import orjson
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
+from cachetools import LRUCache, TTLCache
+from eth_abi import encode
+from eth_utils import function_signature_to_4byte_selector, to_hex
+from web3 import AsyncWeb3, AsyncHTTPProvider, WebsocketProviderV2
+from web3.datastructures import AttributeDict
+from web3.types import BlockIdentifier
 from web3.contract import Contract
 from eth_account import Account
+from app.auth.wallet import wallet_auth
 from app.config import settings
 
+logger = logging.getLogger(__name__)
+
+
+_ABI_PATH = Path(__file__).parent.parent.parent.parent / "agent-payment-vault" / "artifacts" / "contracts" / "AgentPaymentVault.sol" / "AgentPaymentVault.json"
+
+# Minimal AgentPaymentVault ABI, used when the compiled artifact is not available (frozen; copied on use)
+_FALLBACK_VAULT_ABI: Final = (
+    {
+        "inputs": [{"internalType": "address", "name": "fund", "type": "address"}],
+        "name": "getFundAccount",
+        "outputs": [
+            {"internalType": "uint256", "name": "balance", "type": "uint256"},
+            {"internalType": "uint256", "name": "dailySpendingLimit", "type": "uint256"},
+            {"internalType": "uint256", "name": "perTransactionLimit", "type": "uint256"},
+            {"internalType": "uint256", "name": "todaySpent", "type": "uint256"},
+            {"internalType": "uint256", "name": "lastResetDay", "type": "uint256"}
+        ],
+        "stateMutability": "view",
+        "type": "function"
+    },
+    {
+        "inputs": [
+            {"internalType": "address", "name": "fund", "type": "address"},
+            {"internalType": "address", "name": "bot", "type": "address"}
+        ],
+        "name": "isBotAuthorized",
+        "outputs": [{"internalType": "bool", "name": "", "type": "bool"}],
+        "stateMutability": "view",
+        "type": "function"
+    },
+    {
+        "inputs": [{"internalType": "address", "name": "fund", "type": "address"}],
+        "name": "getFundPurchases",
+        "outputs": [{"internalType": "uint256[]", "name": "", "type": "uint256[]"}],
+        "stateMutability": "view",
+        "type": "function"
+    },
+    {
+        "inputs": [{"internalType": "uint256", "name": "purchaseId", "type": "uint256"}],
+        "name": "getPurchase",
+        "outputs": [
+            {
+                "components": [
+                    {"internalType": "address", "name": "fund", "type": "address"},
+                    {"internalType": "address", "name": "bot", "type": "address"},
+                    {"internalType": "address", "name": "recipient", "type": "address"},
+                    {"internalType": "uint256", "name": "amount", "type": "uint256"},
+                    {"internalType": "uint256", "name": "fee", "type": "uint256"},
+                    {"internalType": "uint256", "name": "timestamp", "type": "uint256"},
+                    {"internalType": "string", "name": "metadata", "type": "string"}
+                ],
+                "internalType": "struct AgentPaymentVault.Purchase",
+                "name": "",
+                "type": "tuple"
+            }
+        ],
+        "stateMutability": "view",
+        "type": "function"
+    }
+)
+
+# USDC (ERC20) ABI - only the read methods we call
+_USDC_ABI = [
+    {
+        "inputs": [{"internalType": "address", "name": "account", "type": "address"}],
+        "name": "balanceOf",
+        "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}],
+        "stateMutability": "view",
+        "type": "function"
+    },
+    {
+        "inputs": [],
+        "name": "decimals",
+        "outputs": [{"internalType": "uint8", "name": "", "type": "uint8"}],
+        "stateMutability": "view",
+        "type": "function"
+    }
+]
+
+
+# Multicall3 is deployed at the same address on every major EVM chain
+MULTICALL3_ADDR = "0xcA11bde05977b3631167028862bE2a173976CA11"
+MULTICALL3_ABI = [
+    {
+        "inputs": [
+            {
+                "components": [
+                    {"internalType": "address", "name": "target", "type": "address"},
+                    {"internalType": "bool", "name": "allowFailure", "type": "bool"},
+                    {"internalType": "bytes", "name": "callData", "type": "bytes"}
+                ],
+                "internalType": "struct Multicall3.Call3[]",
+                "name": "calls",
+                "type": "tuple[]"
+            }
+        ],
+        "name": "aggregate3",
+        "outputs": [
+            {
+                "components": [
+                    {"internalType": "bool", "name": "success", "type": "bool"},
+                    {"internalType": "bytes", "name": "returnData", "type": "bytes"}
+                ],
+                "internalType": "struct Multicall3.Result[]",
+                "name": "returnData",
+                "type": "tuple[]"
+            }
+        ],
+        "stateMutability": "payable",
+        "type": "function"
+    }
+]
+
+# HTTP connection pool shared by all RPC calls; sized above expected concurrent requests
+RPC_POOL_LIMIT = 256
+RPC_POOL_LIMIT_PER_HOST = 64
+RPC_KEEPALIVE_TIMEOUT = 30
+RPC_TIMEOUT = ClientTimeout(total=10)
+
+# Seconds a connectivity probe result is reused before is_connected asks the node again
+CONNECTION_CHECK_TTL = 5
+
+# Seconds between receipt lookups while waiting for a transaction to be mined
+RECEIPT_POLL_LATENCY = 0.5
+
+# Cache sizes for view-call results; TTL comes from settings.VIEW_CACHE_TTL
+VIEW_CACHE_SIZE = 4096
+PURCHASE_CACHE_SIZE = 8192
+_MISSING = object()
+
+# ABI output types for decoding raw Multicall3 return data
+_FUND_ACCOUNT_TYPES = ["uint256", "uint256", "uint256", "uint256", "uint256"]
+_PURCHASE_TYPES = ["(address,address,address,uint256,uint256,uint256,string)"]
+
+# 4-byte selectors for calldata assembled by hand in the batched paths, skipping web3's ABI lookup
+_SEL_GET_FUND_ACCOUNT = function_signature_to_4byte_selector("getFundAccount(address)")
+_SEL_GET_FUND_PURCHASES = function_signature_to_4byte_selector("getFundPurchases(address)")
+_SEL_GET_PURCHASE = function_signature_to_4byte_selector("getPurchase(uint256)")
+_SEL_BALANCE_OF = function_signature_to_4byte_selector("balanceOf(address)")
+_SEL_DECIMALS = function_signature_to_4byte_selector("decimals()")
+
+# Struct field names, in ABI output order, and which of them are USDC amounts
+_FUND_ACCOUNT_FIELDS = ("balance", "daily_spending_limit", "per_transaction_limit", "today_spent", "last_reset_day")
+_PURCHASE_FIELDS = ("fund", "bot", "recipient", "amount", "fee", "timestamp", "metadata")
+_USDC_FIELDS = frozenset(("balance", "daily_spending_limit", "per_transaction_limit", "today_spent", "amount", "fee"))
+
+# USDC has 6 decimals; amounts are shifted exactly with Decimal.scaleb rather than divided
+USDC_DECIMALS = 6
+# scaleb still rounds to the active context, so shift under one that never rounds
+_EXACT = Context(prec=MAX_PREC, Emax=MAX_EMAX, Emin=MIN_EMIN)
+
+
+@cache
+def _read_contract_abi() -> list:
+    """
+    Load AgentPaymentVault ABI from artifacts, falling back to the minimal ABI
+    Parsed on first use and shared by every BlockchainService instance
+    """
+    try:
+        with open(_ABI_PATH, 'r') as f:
+            return json.load(f)['abi']
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning("Could not load contract ABI: %s", e)
+    return list(_FALLBACK_VAULT_ABI)
+
+
+_CHECKSUM_CONTRACT = wallet_auth.to_checksum_address(settings.CONTRACT_ADDRESS)
+_CHECKSUM_USDC = wallet_auth.to_checksum_address(settings.USDC_ADDRESS)
+
+
+def _orjson_default(obj):
+    """Serialize the web3 types orjson does not handle natively, as Web3JsonEncoder does"""
+    if isinstance(obj, AttributeDict):
+        return obj.__dict__
+    if isinstance(obj, bytes):
+        return to_hex(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class ORJSONHTTPProvider(AsyncHTTPProvider):
+    """
+    AsyncHTTPProvider that encodes and decodes JSON-RPC payloads with orjson
+    Sends requests through its own pooled keep-alive session rather than web3's session cache
+    """
+
+    session: ClientSession | None = None
+    # Event loop the pooled session was created in
+    _session_loop: asyncio.AbstractEventLoop | None = None
+
+    async def get_session(self) -> ClientSession:
+        """Return the pooled session, (re)creating it in the running loop if missing or closed"""
+        session = self.session
+        loop = asyncio.get_running_loop()
+        if session is None or session.closed or self._session_loop is not loop:
+            if session is not None and not session.closed:
+                # Left over from another (typically since closed) event loop
+                await session.close()
+            connector = TCPConnector(
+                limit=RPC_POOL_LIMIT,
+                limit_per_host=RPC_POOL_LIMIT_PER_HOST,
+                keepalive_timeout=RPC_KEEPALIVE_TIMEOUT,
+            )
+            self.session = ClientSession(connector=connector, timeout=RPC_TIMEOUT, raise_for_status=True)
+            self._session_loop = loop
+        return self.session
+
+    async def close(self):
+        """Close the pooled session"""
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+
+    async def make_request(self, method, params):
+        session = await self.get_session()
+        request_data = self.encode_rpc_request(method, params)
+        async with session.post(self.endpoint_uri, data=request_data, **self.get_request_kwargs()) as response:
+            return self.decode_rpc_response(await response.read())
+
+    def encode_rpc_request(self, method, params) -> bytes:
+        rpc_dict = {
+            "jsonrpc": "2.0",
+            "method": method,
+            "params": params or [],
+            "id": next(self.request_counter),
+        }
+        try:
+            return orjson.dumps(rpc_dict, default=_orjson_default)
+        except orjson.JSONEncodeError:
+            # orjson rejects integers wider than 64 bits; the stdlib encoder handles them
+            return super().encode_rpc_request(method, params)
+
+    def decode_rpc_response(self, raw_response: bytes):
+        return orjson.loads(raw_response)
+
 
 class BlockchainService:
-    """Service for interacting with smart contracts"""
+    """
+    Service for interacting with smart contracts
+    Address arguments are expected in checksum form (see app.auth.wallet.ChecksumAddress)
+    """
 
     def __init__(self):
         """Initialize Web3 connection and contract"""
-        self.w3 = Web3(Web3.HTTPProvider(settings.RPC_URL))
+        self.w3 = AsyncWeb3(ORJSONHTTPProvider(settings.RPC_URL, request_kwargs={"timeout": RPC_TIMEOUT}))
+        # Only eth_call reads and receipt lookups go through here: drop the default middlewares
+        # (validation re-fetches eth_chainId before every call; the rest serve ENS and tx sending)
+        self.w3.middleware_onion.clear()
+
+        # View-call results, reused for about a block; purchases are append-only so never expire
+        self._view_cache = TTLCache(maxsize=VIEW_CACHE_SIZE, ttl=settings.VIEW_CACHE_TTL)
+        self._purchase_cache = LRUCache(maxsize=PURCHASE_CACHE_SIZE)
         self.chain_id = settings.CHAIN_ID
+        self.batching_strategy = settings.RPC_BATCHING_STRATEGY
         self.contract_address = settings.CONTRACT_ADDRESS
         self.usdc_address = settings.USDC_ADDRESS
 
-        # Load contract ABI
-        self.contract_abi = self._load_contract_abi()
-        self.usdc_abi = self._load_usdc_abi()
+        # decimals() of the USDC token, read from the contract on first use
+        self._usdc_decimals: int | None = None
 
-        # Initialize contracts
-        if self.contract_address != "0x0000000000000000000000000000000000000000":
-            self.vault_contract = self.w3.eth.contract(
-                address=Web3.to_checksum_address(self.contract_address),
-                abi=self.contract_abi
-            )
-        else:
-            self.vault_contract = None
+        # Last connectivity probe (monotonic time) and its result
+        self._last_probe = float("-inf")
+        self._last_ok = False
 
-        if self.usdc_address != "0x0000000000000000000000000000000000000000":
-            self.usdc_contract = self.w3.eth.contract(
-                address=Web3.to_checksum_address(self.usdc_address),
-                abi=self.usdc_abi
-            )
-        else:
-            self.usdc_contract = None
+    # Contracts are built on first access, so code paths that never touch one skip its ABI
+    @cached_property
+    def vault_contract(self):
+        """AgentPaymentVault contract, or None if no address is configured"""
+        if self.contract_address == "0x0000000000000000000000000000000000000000":
+            return None
+        return self.w3.eth.contract(address=_CHECKSUM_CONTRACT, abi=self._load_contract_abi())
 
-    def _load_contract_abi(self) -> list:
-        """Load AgentPaymentVault ABI from artifacts"""
-        try:
-            abi_path = Path(__file__).parent.parent.parent.parent / "agent-payment-vault" / "artifacts" / "contracts" / "AgentPaymentVault.sol" / "AgentPaymentVault.json"
-            if abi_path.exists():
-                with open(abi_path, 'r') as f:
-                    contract_json = json.load(f)
-                    return contract_json['abi']
-        except Exception as e:
-            print(f"Warning: Could not load contract ABI: {e}")
+    @cached_property
+    def usdc_contract(self):
+        """USDC token contract, or None if no address is configured"""
+        if self.usdc_address == "0x0000000000000000000000000000000000000000":
+            return None
+        return self.w3.eth.contract(address=_CHECKSUM_USDC, abi=self._load_usdc_abi())
 
-        # Return minimal ABI if file not found
-        return [
-            {
-                "inputs": [{"internalType": "address", "name": "fund", "type": "address"}],
-                "name": "getFundAccount",
-                "outputs": [
-                    {"internalType": "uint256", "name": "balance", "type": "uint256"},
-                    {"internalType": "uint256", "name": "dailySpendingLimit", "type": "uint256"},
-                    {"internalType": "uint256", "name": "perTransactionLimit", "type": "uint256"},
-                    {"internalType": "uint256", "name": "todaySpent", "type": "uint256"},
-                    {"internalType": "uint256", "name": "lastResetDay", "type": "uint256"}
-                ],
-                "stateMutability": "view",
-                "type": "function"
-            },
-            {
-                "inputs": [
-                    {"internalType": "address", "name": "fund", "type": "address"},
-                    {"internalType": "address", "name": "bot", "type": "address"}
-                ],
-                "name": "isBotAuthorized",
-                "outputs": [{"internalType": "bool", "name": "", "type": "bool"}],
-                "stateMutability": "view",
-                "type": "function"
-            },
-            {
-                "inputs": [{"internalType": "address", "name": "fund", "type": "address"}],
-                "name": "getFundPurchases",
-                "outputs": [{"internalType": "uint256[]", "name": "", "type": "uint256[]"}],
-                "stateMutability": "view",
-                "type": "function"
-            },
-            {
-                "inputs": [{"internalType": "uint256", "name": "purchaseId", "type": "uint256"}],
-                "name": "getPurchase",
-                "outputs": [
-                    {
-                        "components": [
-                            {"internalType": "address", "name": "fund", "type": "address"},
-                            {"internalType": "address", "name": "bot", "type": "address"},
-                            {"internalType": "address", "name": "recipient", "type": "address"},
-                            {"internalType": "uint256", "name": "amount", "type": "uint256"},
-                            {"internalType": "uint256", "name": "fee", "type": "uint256"},
-                            {"internalType": "uint256", "name": "timestamp", "type": "uint256"},
-                            {"internalType": "string", "name": "metadata", "type": "string"}
-                        ],
-                        "internalType": "struct AgentPaymentVault.Purchase",
-                        "name": "",
-                        "type": "tuple"
-                    }
-                ],
-                "stateMutability": "view",
-                "type": "function"
-            }
-        ]
+    @cached_property
+    def multicall(self):
+        """Multicall3 contract used to batch view calls"""
+        return self.w3.eth.contract(address=MULTICALL3_ADDR, abi=MULTICALL3_ABI)
+
+    async def startup(self):
+        """
+        Create the pooled keep-alive HTTP session shared by the web3 provider and batch requests
+        Optional: the provider also creates it on the first RPC
+        """
+        await self.w3.provider.get_session()
+
+    async def close(self):
+        """Close the shared HTTP session"""
+        await self.w3.provider.close()
+
+    def _load_contract_abi(self) -> list:
+        """Return the AgentPaymentVault ABI, parsing it on first use"""
+        return _read_contract_abi()
 
     def _load_usdc_abi(self) -> list:
-        """Load USDC (ERC20) ABI"""
-        return [
-            {
-                "inputs": [{"internalType": "address", "name": "account", "type": "address"}],
-                "name": "balanceOf",
-                "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}],
-                "stateMutability": "view",
-                "type": "function"
-            },
-            {
-                "inputs": [],
-                "name": "decimals",
-                "outputs": [{"internalType": "uint8", "name": "", "type": "uint8"}],
-                "stateMutability": "view",
-                "type": "function"
-            }
-        ]
+        """Return the USDC (ERC20) ABI"""
+        return _USDC_ABI
+
+    @staticmethod
+    def _to_usdc(raw: int, decimals: int = USDC_DECIMALS) -> Decimal:
+        """Convert an integer token amount to USDC (exact, independent of the Decimal context)"""
+        return Decimal(raw).scaleb(-decimals, _EXACT)
+
+    @classmethod
+    def _format_struct(cls, fields: tuple, result) -> dict:
+        """Zip a contract struct result with its field names, converting USDC amounts"""
+        return {
+            name: cls._to_usdc(value) if name in _USDC_FIELDS else value
+            for name, value in zip(fields, result)
+        }
+
+    @classmethod
+    def _format_fund_account(cls, result) -> dict:
+        """Convert a getFundAccount result into USDC amounts"""
+        return cls._format_struct(_FUND_ACCOUNT_FIELDS, result)
+
+    @classmethod
+    def _format_purchase(cls, result) -> dict:
+        """Convert a getPurchase result into USDC amounts"""
+        return cls._format_struct(_PURCHASE_FIELDS, result)
+
+    def _decode_purchase(self, data: bytes) -> dict:
+        """Decode raw getPurchase return data"""
+        fund, bot, recipient, *rest = self.w3.codec.decode(_PURCHASE_TYPES, data)[0]
+        to_checksum = wallet_auth.to_checksum_address
+        return self._format_purchase((
+            to_checksum(fund),
+            to_checksum(bot),
+            to_checksum(recipient),
+            *rest,
+        ))
+
+    def _decode_call_result(self, result, types: list):
+        """
+        Decode one Multicall3 aggregate3 result
+        Returns None if the sub-call failed, returned no data (target without code) or is malformed
+        """
+        success, data = result
+        if not success or not data:
+            return None
+        try:
+            return self.w3.codec.decode(types, data)
+        except Exception:
+            return None
+
+    def invalidate(self, fund_address: str):
+        """Drop cached view results for a fund, e.g. after an on-chain purchase or deposit"""
+        for key in [k for k in self._view_cache if fund_address in k[1:]]:
+            self._view_cache.pop(key, None)
 
-    def is_connected(self) -> bool:
-        """Check if Web3 is connected"""
-        return self.w3.is_connected()
+    async def is_connected(self) -> bool:
+        """
+        Check if Web3 is connected
+        The result of the web3_clientVersion probe is reused for CONNECTION_CHECK_TTL seconds
+        """
+        now = time.monotonic()
+        if now - self._last_probe >= CONNECTION_CHECK_TTL:
+            try:
+                self._last_ok = await self.w3.is_connected()
+            except Exception as e:
+                # web3 only treats OSError as "not connected"; HTTP errors (429, 503) raise instead
+                logger.debug("Connectivity probe failed: %s", e)
+                self._last_ok = False
+            self._last_probe = now
+        return self._last_ok
 
-    def get_fund_balance(self, fund_address: str) -> dict:
+    async def get_fund_balance(self, fund_address: str, block_identifier: BlockIdentifier = "latest") -> dict:
         """
         Get fund account balance from contract
         Returns balance, limits, and spending info
@@ -138,90 +401,318 @@ class BlockchainService:
         if not self.vault_contract:
             return {"error": "Contract not initialized"}
 
+        key = ("get_fund_balance", fund_address, block_identifier)
+        cached = self._view_cache.get(key, _MISSING)
+        if cached is not _MISSING:
+            return cached
+
         try:
-            checksum_address = Web3.to_checksum_address(fund_address)
-            result = self.vault_contract.functions.getFundAccount(checksum_address).call()
-
-            return {
-                "balance": result[0] / 1e6,  # Convert from 6 decimals to USDC
-                "daily_spending_limit": result[1] / 1e6,
-                "per_transaction_limit": result[2] / 1e6,
-                "today_spent": result[3] / 1e6,
-                "last_reset_day": result[4],
-            }
+            result = await self.vault_contract.functions.getFundAccount(fund_address).call(block_identifier=block_identifier)
         except Exception as e:
             return {"error": str(e)}
 
-    def is_bot_authorized(self, fund_address: str, bot_address: str) -> bool:
+        self._view_cache[key] = balance = self._format_fund_account(result)
+        return balance
+
+    async def is_bot_authorized(
+        self, fund_address: str, bot_address: str, block_identifier: BlockIdentifier = "latest"
+    ) -> bool:
         """Check if a bot is authorized for a fund"""
         if not self.vault_contract:
             return False
 
+        key = ("is_bot_authorized", fund_address, bot_address, block_identifier)
+        cached = self._view_cache.get(key, _MISSING)
+        if cached is not _MISSING:
+            return cached
+
         try:
-            checksum_fund = Web3.to_checksum_address(fund_address)
-            checksum_bot = Web3.to_checksum_address(bot_address)
-            return self.vault_contract.functions.isBotAuthorized(checksum_fund, checksum_bot).call()
-        except Exception as e:
-            print(f"Error checking bot authorization: {e}")
+            authorized = await self.vault_contract.functions.isBotAuthorized(fund_address, bot_address).call(
+                block_identifier=block_identifier
+            )
+        except Exception:
+            logger.exception("Error checking bot authorization")
             return False
 
-    def get_fund_purchases(self, fund_address: str) -> list:
+        self._view_cache[key] = authorized
+        return authorized
+
+    async def get_fund_purchases(self, fund_address: str, block_identifier: BlockIdentifier = "latest") -> list:
         """Get all purchase IDs for a fund"""
         if not self.vault_contract:
             return []
 
         try:
-            checksum_address = Web3.to_checksum_address(fund_address)
-            purchase_ids = self.vault_contract.functions.getFundPurchases(checksum_address).call()
+            purchase_ids = await self.vault_contract.functions.getFundPurchases(fund_address).call(
+                block_identifier=block_identifier
+            )
             return purchase_ids
-        except Exception as e:
-            print(f"Error getting fund purchases: {e}")
+        except Exception:
+            logger.exception("Error getting fund purchases")
             return []
 
-    def get_purchase_details(self, purchase_id: int) -> dict:
+    async def get_purchase_details(self, purchase_id: int) -> dict:
         """Get details of a specific purchase"""
         if not self.vault_contract:
             return {"error": "Contract not initialized"}
 
+        cached = self._purchase_cache.get(purchase_id, _MISSING)
+        if cached is not _MISSING:
+            return cached
+
         try:
-            result = self.vault_contract.functions.getPurchase(purchase_id).call()
-            return {
-                "fund": result[0],
-                "bot": result[1],
-                "recipient": result[2],
-                "amount": result[3] / 1e6,  # Convert to USDC
-                "fee": result[4] / 1e6,
-                "timestamp": result[5],
-                "metadata": result[6],
-            }
+            result = await self.vault_contract.functions.getPurchase(purchase_id).call()
         except Exception as e:
             return {"error": str(e)}
 
-    def get_usdc_balance(self, address: str) -> float:
+        self._purchase_cache[purchase_id] = purchase = self._format_purchase(result)
+        return purchase
+
+    async def _get_usdc_decimals(self) -> int:
+        """Return decimals() for the USDC token, read once and then cached"""
+        if self._usdc_decimals is None:
+            self._usdc_decimals = await self.usdc_contract.functions.decimals().call()
+        return self._usdc_decimals
+
+    async def get_usdc_balance(self, address: str, block_identifier: BlockIdentifier = "latest") -> Decimal:
         """Get USDC balance for an address"""
         if not self.usdc_contract:
-            return 0.0
+            return Decimal(0)
+
+        key = ("get_usdc_balance", address, block_identifier)
+        cached = self._view_cache.get(key, _MISSING)
+        if cached is not _MISSING:
+            return cached
 
         try:
-            checksum_address = Web3.to_checksum_address(address)
-            balance = self.usdc_contract.functions.balanceOf(checksum_address).call()
-            return balance / 1e6  # Convert from 6 decimals
+            decimals = await self._get_usdc_decimals()
+            balance = await self.usdc_contract.functions.balanceOf(address).call(block_identifier=block_identifier)
+        except Exception:
+            logger.exception("Error getting USDC balance")
+            return Decimal(0)
+
+        self._view_cache[key] = usdc_balance = self._to_usdc(balance, decimals)
+        return usdc_balance
+
+    async def get_consistent_fund_state(self, fund_address: str) -> dict:
+        """
+        Get fund balance and purchase IDs as of one block
+        Resolves the latest block number once and pins both reads to it
+        """
+        if not self.vault_contract:
+            return {"error": "Contract not initialized"}
+
+        try:
+            block_number = await self.w3.eth.block_number
         except Exception as e:
-            print(f"Error getting USDC balance: {e}")
-            return 0.0
+            return {"error": str(e)}
+
+        balance, purchase_ids = await asyncio.gather(
+            self.get_fund_balance(fund_address, block_identifier=block_number),
+            self.get_fund_purchases(fund_address, block_identifier=block_number),
+        )
+        return {"block_number": block_number, "balance": balance, "purchase_ids": purchase_ids}
+
+    async def get_fund_overview(self, fund_address: str) -> dict:
+        """
+        Get fund balance, purchase IDs and USDC wallet balance together
+        Batched according to RPC_BATCHING_STRATEGY; a failing read falls back to its default
+        """
+        if not self.vault_contract:
+            return {"error": "Contract not initialized"}
+
+        if self.batching_strategy == "multicall":
+            return await self._get_fund_overview_multicall(fund_address)
+        return await self._get_fund_overview_concurrent(fund_address)
+
+    async def _get_fund_overview_concurrent(self, fund_address: str) -> dict:
+        """Run the three overview reads as concurrent RPCs, for nodes without Multicall3"""
+        balance, purchase_ids, usdc_balance = await asyncio.gather(
+            self.get_fund_balance(fund_address),
+            self.get_fund_purchases(fund_address),
+            self.get_usdc_balance(fund_address),
+            return_exceptions=True,
+        )
+
+        return {
+            "balance": {"error": str(balance)} if isinstance(balance, Exception) else balance,
+            "purchase_ids": [] if isinstance(purchase_ids, Exception) else purchase_ids,
+            "usdc_wallet_balance": Decimal(0) if isinstance(usdc_balance, Exception) else usdc_balance,
+        }
+
+    async def _get_fund_overview_multicall(self, fund_address: str) -> dict:
+        """
+        Read the overview in a single eth_call
+        Reads are batched through Multicall3 aggregate3, so they share one RPC and block
+        """
+        fetch_decimals = self.usdc_contract is not None and self._usdc_decimals is None
+
+        try:
+            address_arg = encode(["address"], [fund_address])
+            calls = [
+                (self.vault_contract.address, True, _SEL_GET_FUND_ACCOUNT + address_arg),
+                (self.vault_contract.address, True, _SEL_GET_FUND_PURCHASES + address_arg),
+            ]
+            if self.usdc_contract:
+                calls.append((self.usdc_contract.address, True, _SEL_BALANCE_OF + address_arg))
+            if fetch_decimals:
+                # First fetch: read the token decimals in the same eth_call
+                calls.append((self.usdc_contract.address, True, _SEL_DECIMALS))
+
+            results = await self.multicall.functions.aggregate3(calls).call()
+        except Exception as e:
+            return {"error": str(e)}
+
+        # Failed sub-calls fall back to the same defaults as the single-read methods
+        account = self._decode_call_result(results[0], _FUND_ACCOUNT_TYPES)
+        purchases = self._decode_call_result(results[1], ["uint256[]"])
+        usdc = self._decode_call_result(results[2], ["uint256"]) if self.usdc_contract else None
+        if fetch_decimals:
+            decimals = self._decode_call_result(results[3], ["uint8"])
+            if decimals is not None:
+                self._usdc_decimals = decimals[0]
+        if self._usdc_decimals is None:
+            usdc = None
+
+        return {
+            "balance": (
+                self._format_fund_account(account) if account is not None
+                else {"error": "getFundAccount call failed"}
+            ),
+            "purchase_ids": list(purchases[0]) if purchases is not None else [],
+            "usdc_wallet_balance": self._to_usdc(usdc[0], self._usdc_decimals) if usdc is not None else Decimal(0),
+        }
+
+    async def get_purchases_batch(self, purchase_ids: list[int]) -> list[dict]:
+        """
+        Get details of many purchases in a single Multicall3 eth_call
+        Returns one dict per id, in order; failed reads are returned as error dicts
+        """
+        if not self.vault_contract:
+            return [{"error": "Contract not initialized"} for _ in purchase_ids]
+        if not purchase_ids:
+            return []
 
-    def get_transaction_receipt(self, tx_hash: str) -> dict:
-        """Get transaction receipt"""
         try:
-            receipt = self.w3.eth.get_transaction_receipt(tx_hash)
-            return {
-                "status": receipt["status"],
-                "block_number": receipt["blockNumber"],
-                "gas_used": receipt["gasUsed"],
+            calls = [
+                (self.vault_contract.address, True, _SEL_GET_PURCHASE + encode(["uint256"], [purchase_id]))
+                for purchase_id in purchase_ids
+            ]
+            results = await self.multicall.functions.aggregate3(calls).call()
+        except Exception as e:
+            return [{"error": str(e)} for _ in purchase_ids]
+
+        purchases = []
+        for success, data in results:
+            # A target without code "succeeds" with empty returnData
+            if not success or not data:
+                purchases.append({"error": "getPurchase call failed"})
+                continue
+            try:
+                purchases.append(self._decode_purchase(data))
+            except Exception as e:
+                purchases.append({"error": str(e)})
+        return purchases
+
+    async def get_purchases_bulk(self, purchase_ids: list[int]) -> list[dict]:
+        """
+        Get details of many purchases with one JSON-RPC 2.0 batch request
+        Alternative to get_purchases_batch for RPCs without Multicall3 or that favor batches
+        """
+        if not self.vault_contract:
+            return [{"error": "Contract not initialized"} for _ in purchase_ids]
+        if not purchase_ids:
+            return []
+
+        batch = [
+            {
+                "jsonrpc": "2.0",
+                "id": i,
+                "method": "eth_call",
+                "params": [
+                    {
+                        "to": self.vault_contract.address,
+                        "data": "0x" + (_SEL_GET_PURCHASE + encode(["uint256"], [purchase_id])).hex(),
+                    },
+                    "latest",
+                ],
             }
+            for i, purchase_id in enumerate(purchase_ids)
+        ]
+
+        try:
+            session = await self.w3.provider.get_session()
+            async with session.post(
+                settings.RPC_URL, data=orjson.dumps(batch), headers={"Content-Type": "application/json"}
+            ) as response:
+                # Batch responses may come back in any order
+                responses = {r["id"]: r for r in orjson.loads(await response.read())}
+        except Exception as e:
+            return [{"error": str(e)} for _ in purchase_ids]
+
+        purchases = []
+        for i in range(len(purchase_ids)):
+            r = responses.get(i, {})
+            if "result" not in r:
+                purchases.append({"error": str(r.get("error", "getPurchase call failed"))})
+                continue
+            try:
+                purchases.append(self._decode_purchase(bytes.fromhex(r["result"][2:])))
+            except Exception as e:
+                purchases.append({"error": str(e)})
+        return purchases
+
+    async def get_purchases(self, purchase_ids: list[int]) -> list[dict]:
+        """Get details of many purchases, batched according to RPC_BATCHING_STRATEGY"""
+        if self.batching_strategy == "jsonrpc":
+            return await self.get_purchases_bulk(purchase_ids)
+        return await self.get_purchases_batch(purchase_ids)
+
+    @staticmethod
+    def _format_receipt(receipt) -> dict:
+        """Pick the receipt fields returned by the API"""
+        return {
+            "status": receipt["status"],
+            "block_number": receipt["blockNumber"],
+            "gas_used": receipt["gasUsed"],
+        }
+
+    async def get_transaction_receipt(self, tx_hash: str) -> dict:
+        """Get transaction receipt"""
+        try:
+            receipt = await self.w3.eth.get_transaction_receipt(tx_hash)
+            return self._format_receipt(receipt)
         except Exception as e:
             return {"error": str(e)}
 
+    async def wait_for_receipt(self, tx_hash: str, timeout: float = 120) -> dict:
+        """
+        Wait until a transaction is mined and return its receipt
+        Uses a persistent websocket when WSS_URL is set, otherwise polls over HTTP
+        """
+        try:
+            if settings.WSS_URL:
+                # One connection per wait: requests on a shared websocket must not run concurrently
+                async with AsyncWeb3.persistent_websocket(
+                    WebsocketProviderV2(settings.WSS_URL), middlewares=[]
+                ) as w3_ws:
+                    receipt = await asyncio.wait_for(
+                        w3_ws.eth.wait_for_transaction_receipt(
+                            tx_hash, timeout=timeout, poll_latency=RECEIPT_POLL_LATENCY
+                        ),
+                        timeout,
+                    )
+            else:
+                receipt = await self.w3.eth.wait_for_transaction_receipt(
+                    tx_hash, timeout=timeout, poll_latency=RECEIPT_POLL_LATENCY
+                )
+        except Exception as e:
+            return {"error": str(e)}
+
+        return self._format_receipt(receipt)
+
 
-# Create global instance
-blockchain_service = BlockchainService()
+@cache
+def get_blockchain_service() -> BlockchainService:
+    """Return the shared service, creating it on first use rather than at import"""
+    return BlockchainService()
@@ -5,81 +5,117 @@ Run this after starting the backend to add agents to the marketplace
 import asyncio
 import sys
 from decimal import Decimal
-from app.database import AsyncSessionLocal
+from sqlalchemy.dialects import postgresql, sqlite
+from app.database import AsyncSessionLocal, engine
 from app.models.agent import Agent
 
+# Dialect-specific INSERT constructs that support ON CONFLICT DO NOTHING
+_DIALECT_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+USDC_DECIMALS = 6
+
+# Emoji decoration is only used on an interactive terminal, not in piped or CI logs
+_TTY = sys.stdout.isatty()
+
+
+def _icon(symbol: str) -> str:
+    """Return the symbol plus a space on a terminal, or nothing when output is piped"""
+    return f"{symbol} " if _TTY else ""
+
+
+# Sample agents as column names plus positional rows, inserted straight into the agents table
+# Wallets are EIP-55 literals; prices are USDC base units (6 decimals), matching on-chain amounts
+SAMPLE_AGENT_COLUMNS = ("name", "wallet_address", "price", "description", "image_url", "is_active")
+SAMPLE_AGENTS = (
+    (
+        "ResearchGPT",
+        "0x1234567890123456789012345678901234567890",
+        25_000_000,
+        "Autonomous research agent that gathers, analyzes, and summarizes information from multiple sources. Perfect for market research and competitive analysis.",
+        "https://via.placeholder.com/400x300?text=ResearchGPT",
+        True,
+    ),
+    (
+        "DataAnalyzer Pro",
+        "0x2345678901234567890123456789012345678901",
+        50_000_000,
+        "Advanced data analysis agent with machine learning capabilities. Processes large datasets and generates actionable insights automatically.",
+        "https://via.placeholder.com/400x300?text=DataAnalyzer",
+        True,
+    ),
+    (
+        "ContentCreator AI",
+        "0x3456789012345678901234567890123456789012",
+        30_000_000,
+        "Creative writing agent for blog posts, social media, and marketing copy. Maintains brand voice and generates SEO-optimized content.",
+        "https://via.placeholder.com/400x300?text=ContentCreator",
+        True,
+    ),
+    (
+        "CodeAssistant",
+        "0x4567890123456789012345678901234567890123",
+        75_000_000,
+        "AI coding assistant that writes, reviews, and debugs code across multiple languages. Integrates with GitHub for automated PR reviews.",
+        "https://via.placeholder.com/400x300?text=CodeAssistant",
+        True,
+    ),
+    (
+        "CustomerSupport Bot",
+        "0x5678901234567890123456789012345678901234",
+        40_000_000,
+        "24/7 customer support agent with natural language understanding. Handles inquiries, escalates complex issues, and maintains conversation context.",
+        "https://via.placeholder.com/400x300?text=CustomerSupport",
+        True,
+    ),
+)
+
 
 async def seed_agents():
     """Add sample AI agents to the database"""
 
-    sample_agents = [
-        {
-            "name": "ResearchGPT",
-            "wallet_address": "0x1234567890123456789012345678901234567890",
-            "price": Decimal("25.00"),
-            "description": "Autonomous research agent that gathers, analyzes, and summarizes information from multiple sources. Perfect for market research and competitive analysis.",
-            "image_url": "https://via.placeholder.com/400x300?text=ResearchGPT",
-            "is_active": True,
-        },
-        {
-            "name": "DataAnalyzer Pro",
-            "wallet_address": "0x2345678901234567890123456789012345678901",
-            "price": Decimal("50.00"),
-            "description": "Advanced data analysis agent with machine learning capabilities. Processes large datasets and generates actionable insights automatically.",
-            "image_url": "https://via.placeholder.com/400x300?text=DataAnalyzer",
-            "is_active": True,
-        },
-        {
-            "name": "ContentCreator AI",
-            "wallet_address": "0x3456789012345678901234567890123456789012",
-            "price": Decimal("30.00"),
-            "description": "Creative writing agent for blog posts, social media, and marketing copy. Maintains brand voice and generates SEO-optimized content.",
-            "image_url": "https://via.placeholder.com/400x300?text=ContentCreator",
-            "is_active": True,
-        },
-        {
-            "name": "CodeAssistant",
-            "wallet_address": "0x4567890123456789012345678901234567890123",
-            "price": Decimal("75.00"),
-            "description": "AI coding assistant that writes, reviews, and debugs code across multiple languages. Integrates with GitHub for automated PR reviews.",
-            "image_url": "https://via.placeholder.com/400x300?text=CodeAssistant",
-            "is_active": True,
-        },
-        {
-            "name": "CustomerSupport Bot",
-            "wallet_address": "0x5678901234567890123456789012345678901234",
-            "price": Decimal("40.00"),
-            "description": "24/7 customer support agent with natural language understanding. Handles inquiries, escalates complex issues, and maintains conversation context.",
-            "image_url": "https://via.placeholder.com/400x300?text=CustomerSupport",
-            "is_active": True,
-        },
+    # Decimal prices are only constructed here, for the rows being inserted
+    rows = [
+        (name, wallet_address, Decimal(price).scaleb(-USDC_DECIMALS), description, image_url, is_active)
+        for name, wallet_address, price, description, image_url, is_active in SAMPLE_AGENTS
     ]
 
     async with AsyncSessionLocal() as session:
         try:
-            # Add all agents
-            for agent_data in sample_agents:
-                agent = Agent(**agent_data)
-                session.add(agent)
+            # Add all agents in one Core executemany INSERT on the table (no ORM instances),
+            # skipping wallets that are already seeded; RETURNING reports which rows went in
+            insert = _DIALECT_INSERTS[engine.dialect.name]
+            result = await session.execute(
+                insert(Agent.__table__)
+                .on_conflict_do_nothing(index_elements=["wallet_address"])
+                .returning(Agent.__table__.c.wallet_address),
+                [dict(zip(SAMPLE_AGENT_COLUMNS, row)) for row in rows],
+            )
+            inserted = set(result.scalars().all())
 
             await session.commit()
-            print(f"✅ Successfully added {len(sample_agents)} sample AI agents to the database!")
 
-            # Print agent details
-            print("\n📋 Sample AI Agents:")
-            print("-" * 80)
-            for agent_data in sample_agents:
-                print(f"  • {agent_data['name']}")
-                print(f"    Price: ${agent_data['price']}")
-                print(f"    Wallet: {agent_data['wallet_address']}")
-                print()
+            # Print the summary and agent details in a single write
+            added = [row for row in rows if row[1] in inserted]
+            lines = [
+                f"{_icon('✅')}Seeded {len(added)} sample AI agents into the database "
+                f"({len(rows) - len(added)} already present)\n",
+            ]
+            if added:
+                lines.append(f"\n{_icon('📋')}Sample AI Agents:\n")
+                lines.append("-" * 80 + "\n")
+            bullet = "•" if _TTY else "-"
+            lines.extend(
+                f"  {bullet} {name}\n    Price: ${price:.2f}\n    Wallet: {wallet_address}\n\n"
+                for name, wallet_address, price, *_ in added
+            )
+            sys.stdout.write("".join(lines))
 
         except Exception as e:
-            print(f"❌ Error seeding agents: {e}")
+            print(f"{_icon('❌')}Error seeding agents: {e}")
             await session.rollback()
             sys.exit(1)
 
 
 if __name__ == "__main__":
-    print("🌱 Seeding database with sample AI agents...")
+    print(f"{_icon('🌱')}Seeding database with sample AI agents...")
     asyncio.run(seed_agents())